@@ -9,43 +9,75 @@ How it works:
 1. pynput.keyboard.Listener captures ALL keyboard events system-wide
 2. Each keypress/release is broadcast to all connected WebSocket clients as JSON
 3. Modifier key states (shift, ctrl, alt, etc.) are tracked and sent with events
-4. A simple HTTP server serves the static frontend files
+4. A uvicorn/Starlette static file server runs on the same event loop
 
 Requires macOS Accessibility permission:
   System Preferences → Privacy & Security → Accessibility → Add Terminal
 """
 
 import asyncio
-import json
 import time
-import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from functools import partial
 import os
+from functools import partial
 
 # Third-party imports
+import orjson
 from pynput import keyboard
+import uvicorn
 import websockets
+from websockets import broadcast as ws_broadcast
+from websockets.protocol import State
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+# Module-local binding skips the attribute lookup on the hot path
+_time_ns = time.time_ns
 
 # Configuration
 HTTP_PORT = 8080
 WS_PORT = 8765
 STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
-# Global set of connected WebSocket clients
-connected_clients = set()
+# Connected WebSocket clients: a list so broadcast iterates without a
+# set-iterator allocation, plus an index map for O(1) swap-remove
+connected_clients = []
+_client_index = {}
+
+
+def register_client(websocket):
+    """Add a client to the broadcast list."""
+    _client_index[websocket] = len(connected_clients)
+    connected_clients.append(websocket)
+
+
+def unregister_client(websocket):
+    """Remove a client via swap-remove, keeping the list dense."""
+    index = _client_index.pop(websocket, None)
+    if index is None:
+        return
+    last = connected_clients.pop()
+    if last is not websocket:
+        connected_clients[index] = last
+        _client_index[last] = index
 
 # Async event loop reference (set in main)
 loop = None
 
-# Track modifier key states
-modifier_state = {
-    'shift': False,
-    'ctrl': False,
-    'alt': False,
-    'cmd': False,
-    'caps_lock': False
-}
+# Queue of pending events, drained by broadcast_events (set in main)
+event_queue = None
+
+# Pre-bound loop.call_soon_threadsafe(event_queue.put_nowait, ...) so the
+# listener thread hands an event over with a single call (set in main)
+_enqueue = None
+
+# Cap on how many events get coalesced into a single frame
+MAX_BATCH = 32
+
+# Track modifier key states as a bitmask (one bit per modifier below)
+MOD_NAMES = ('shift', 'ctrl', 'alt', 'cmd', 'caps_lock')
+MOD_BITS = {name: 1 << i for i, name in enumerate(MOD_NAMES)}
+modifier_bits: int = 0
 
 # Map pynput key names to our modifier names
 MODIFIER_KEYS = {
@@ -56,6 +88,24 @@ MODIFIER_KEYS = {
     'caps_lock': ['caps_lock']
 }
 
+# Reverse map for O(1) lookup on the hot path: 'shift_l' -> 'shift', etc.
+KEY_TO_MOD = {k: mod for mod, keys in MODIFIER_KEYS.items() for k in keys}
+
+# Only 2^5 modifier combinations exist, so every possible "modifiers"
+# JSON object is serialized once here and looked up by bitmask on the
+# hot path instead of being re-encoded per keypress
+MOD_FRAGMENTS = {
+    bits: b'"modifiers":' + orjson.dumps(
+        {name: bool(bits & MOD_BITS[name]) for name in MOD_NAMES}
+    )
+    for bits in range(1 << len(MOD_NAMES))
+}
+
+# The event schema is fixed, so messages are built by filling these
+# byte templates rather than serializing a fresh dict per event
+KEY_EVENT_TMPL = b'{"type":"%b","key":%b,%b,"timestamp":%d}'
+MOD_EVENT_TMPL = b'{"type":"modifier","key":"%b","value":%b,"timestamp":%d}'
+
 # Special keys we care about
 SPECIAL_KEYS = {
     'space': 'space',
@@ -74,149 +124,190 @@ SPECIAL_KEYS = {
 }
 
 
-def get_key_name(key):
+# Map pynput Key enum members straight to their names, so non-char keys
+# don't pay str(key) + replace + lower per event
+KEY_ID_TO_NAME = {key: key.name for key in keyboard.Key}
+
+
+def get_key_name(key) -> str:
     """Extract the key name from a pynput key object."""
-    if hasattr(key, 'char') and key.char is not None:
-        return key.char.lower()
-    else:
-        return str(key).replace('Key.', '').lower()
+    if isinstance(key, keyboard.KeyCode):
+        return key.char.lower() if key.char is not None else ''
+    return KEY_ID_TO_NAME.get(key, '')
 
 
-def is_modifier_key(key_name):
-    """Check if a key name is a modifier key."""
-    for mod_name, mod_keys in MODIFIER_KEYS.items():
-        if key_name in mod_keys:
-            return mod_name
-    return None
+def is_modifier_key(key_name: str) -> str | None:
+    """Return the modifier name for a key name, or None."""
+    return KEY_TO_MOD.get(key_name)
 
 
-def on_key_press(key):
+def on_key_press(key) -> None:
     """
     Callback for pynput keyboard listener - key press events.
     """
-    global modifier_state
-    
+    global modifier_bits
+
     try:
         key_name = get_key_name(key)
-        
+
         # Check if it's a modifier key
         mod_name = is_modifier_key(key_name)
         if mod_name:
-            modifier_state[mod_name] = True
+            modifier_bits |= MOD_BITS[mod_name]
             # Send modifier state update
             send_event('modifier', mod_name, True)
             return
         
-        # Check if it's a special key we care about
-        if key_name in SPECIAL_KEYS:
-            key_str = SPECIAL_KEYS[key_name]
-        elif hasattr(key, 'char') and key.char is not None:
-            key_str = key.char.lower()
-        else:
-            # Ignore other keys
-            return
-        
+        # Check if it's a special key we care about (single dict lookup)
+        key_str = SPECIAL_KEYS.get(key_name)
+        if key_str is None:
+            if hasattr(key, 'char') and key.char is not None:
+                key_str = key.char.lower()
+            else:
+                # Ignore other keys
+                return
+
         # Send keydown event with modifier states
-        send_event('keydown', key_str, modifier_state.copy())
+        send_event('keydown', key_str, None)
             
     except Exception as e:
         print(f"Error processing key press: {e}", flush=True)
 
 
-def on_key_release(key):
+def on_key_release(key) -> None:
     """
     Callback for pynput keyboard listener - key release events.
     """
-    global modifier_state
-    
+    global modifier_bits
+
     try:
         key_name = get_key_name(key)
-        
+
         # Check if it's a modifier key
         mod_name = is_modifier_key(key_name)
         if mod_name:
-            modifier_state[mod_name] = False
+            modifier_bits &= ~MOD_BITS[mod_name]
             # Send modifier state update
             send_event('modifier', mod_name, False)
             return
         
-        # Check if it's a special key we care about
-        if key_name in SPECIAL_KEYS:
-            key_str = SPECIAL_KEYS[key_name]
-        elif hasattr(key, 'char') and key.char is not None:
-            key_str = key.char.lower()
-        else:
-            return
-        
+        # Check if it's a special key we care about (single dict lookup)
+        key_str = SPECIAL_KEYS.get(key_name)
+        if key_str is None:
+            if hasattr(key, 'char') and key.char is not None:
+                key_str = key.char.lower()
+            else:
+                return
+
         # Send keyup event
-        send_event('keyup', key_str, modifier_state.copy())
+        send_event('keyup', key_str, None)
             
     except Exception as e:
         print(f"Error processing key release: {e}", flush=True)
 
 
-def send_event(event_type, key, data):
-    """Create and send an event message."""
-    message = json.dumps({
-        "type": event_type,
-        "key": key,
-        "modifiers": modifier_state if event_type in ['keydown', 'keyup'] else None,
-        "value": data if event_type == 'modifier' else None,
-        "timestamp": int(time.time() * 1000)
-    })
-    
-    if loop and connected_clients:
-        asyncio.run_coroutine_threadsafe(broadcast(message), loop)
+def send_event(event_type: str, key: str, data) -> None:
+    """Serialize an event to JSON bytes and queue it for broadcast."""
+    # Nobody listening (the common idle case): skip serialization entirely
+    if not connected_clients or _enqueue is None:
+        return
+
+    # Integer-only ms timestamp; same wall-clock semantics as
+    # int(time.time() * 1000) without the float multiply + cast
+    timestamp = _time_ns() // 1_000_000
 
+    if event_type == 'modifier':
+        # key is one of our fixed modifier names, so no escaping needed
+        payload = MOD_EVENT_TMPL % (
+            key.encode(), b'true' if data else b'false', timestamp)
+    else:
+        # Hot path: fill the template with the pre-serialized modifier
+        # fragment — no dict is built or serialized per keypress; only
+        # the key needs JSON escaping (it can be any typed character)
+        payload = KEY_EVENT_TMPL % (
+            event_type.encode(), orjson.dumps(key),
+            MOD_FRAGMENTS[modifier_bits], timestamp)
 
-async def broadcast(message):
-    """Send a message to all connected WebSocket clients."""
-    if connected_clients:
-        tasks = [asyncio.create_task(safe_send(client, message)) for client in connected_clients]
-        await asyncio.gather(*tasks)
+    _enqueue(payload)
 
 
-async def safe_send(websocket, message):
-    """Send message to a single client, removing it if disconnected."""
-    try:
-        await websocket.send(message)
-    except websockets.exceptions.ConnectionClosed:
-        connected_clients.discard(websocket)
+async def broadcast_events():
+    """
+    Consume queued events and broadcast them to all clients.
+
+    Each wake drains everything pending on the queue, so a burst of fast
+    typing goes out as one "batch" frame instead of one frame per key.
+    """
+    while True:
+        batch = [await event_queue.get()]
+        while len(batch) < MAX_BATCH:
+            try:
+                batch.append(event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        # Events arrive pre-serialized, so batching is a bytes join; the
+        # frame goes out as binary either way (no UTF-8 encode pass).
+        if len(batch) == 1:
+            message = batch[0]
+        else:
+            message = b'{"type":"batch","events":[' + b','.join(batch) + b']}'
+
+        if connected_clients:
+            # ws_broadcast serializes the frame once and writes it into each
+            # client's send buffer synchronously (closed sockets are skipped),
+            # so no per-client coroutine/task is created.
+            ws_broadcast(connected_clients, message)
+
+            # Collect dead sockets first, then drop them in one pass —
+            # never mutate the registry while broadcast iterates it.
+            # Handlers also unregister on exit; this just stops us
+            # re-offering sockets that closed before their handler woke.
+            dead = [ws for ws in connected_clients if ws.state is not State.OPEN]
+            for ws in dead:
+                unregister_client(ws)
 
 
 async def websocket_handler(websocket, path=None):
     """Handle a new WebSocket connection."""
-    connected_clients.add(websocket)
+    register_client(websocket)
     print(f"Client connected. Total clients: {len(connected_clients)}", flush=True)
-    
+
     try:
         async for message in websocket:
             pass  # Client messages ignored for now
     except websockets.exceptions.ConnectionClosed:
         pass
     finally:
-        connected_clients.discard(websocket)
+        unregister_client(websocket)
         print(f"Client disconnected. Total clients: {len(connected_clients)}", flush=True)
 
 
-def run_http_server():
-    """Run the HTTP server for static files in a separate thread."""
-    os.chdir(STATIC_DIR)
-    handler = partial(SimpleHTTPRequestHandler, directory=STATIC_DIR)
-    httpd = HTTPServer(('localhost', HTTP_PORT), handler)
-    print(f"HTTP server running at http://localhost:{HTTP_PORT}", flush=True)
-    httpd.serve_forever()
+def make_http_server():
+    """Build the uvicorn server that serves the static frontend."""
+    app = Starlette(routes=[
+        Mount('/', StaticFiles(directory=STATIC_DIR, html=True))
+    ])
+    config = uvicorn.Config(app, host='localhost', port=HTTP_PORT,
+                            log_level='warning')
+    return uvicorn.Server(config)
 
 
 async def main():
     """Main entry point - starts all services."""
-    global loop
+    global loop, event_queue, _enqueue
     loop = asyncio.get_event_loop()
-    
-    # Start HTTP server in background thread
-    http_thread = threading.Thread(target=run_http_server, daemon=True)
-    http_thread.start()
-    
+    event_queue = asyncio.Queue()
+    _enqueue = partial(loop.call_soon_threadsafe, event_queue.put_nowait)
+
+    # Consume queued keypresses and fan them out to clients
+    asyncio.create_task(broadcast_events())
+
+    # Serve static files on this loop: uvicorn gives us sendfile() and
+    # HTTP/1.1 keep-alive, and there's no extra HTTP thread
+    asyncio.create_task(make_http_server().serve())
+    print(f"HTTP server running at http://localhost:{HTTP_PORT}", flush=True)
+
     # Start keyboard listener in background thread with both press and release handlers
     listener = keyboard.Listener(on_press=on_key_press, on_release=on_key_release)
     listener.start()
@@ -224,7 +315,10 @@ async def main():
     
     # Start WebSocket server
     print(f"WebSocket server running at ws://localhost:{WS_PORT}", flush=True)
-    async with websockets.serve(websocket_handler, "localhost", WS_PORT):
+    # compression=None: zlib on ~100-byte localhost frames is pure CPU
+    # cost per broadcast with no bandwidth payoff
+    async with websockets.serve(websocket_handler, "localhost", WS_PORT,
+                                compression=None):
         print("\n" + "="*50, flush=True)
         print("KEYWAVE is running!", flush=True)
         print(f"Open http://localhost:{HTTP_PORT} in your browser", flush=True)
@@ -235,6 +329,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        # libuv-backed loop; noticeably faster WebSocket fan-out
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -2226,6 +2226,31 @@ function updateEffectSliders() {
 
 let ws = null;
 let wsConnected = false;
+const wsDecoder = new TextDecoder();
+
+function handleWsEvent(data) {
+    // Skip WebSocket events if typing box is focused (avoid duplicates)
+    if (typingBoxFocused && (data.type === 'keydown' || data.type === 'keyup')) {
+        return;
+    }
+
+    if (data.type === 'keydown') {
+        // Ignore key repeats (key already held down)
+        if (heldKeys.has(data.key)) return;
+        heldKeys.add(data.key);
+
+        if (data.modifiers) {
+            Object.assign(modifiers, data.modifiers);
+            updateModifierDisplay();
+        }
+        handleKeyDown(data.key, modifiers, false);
+    } else if (data.type === 'keyup') {
+        heldKeys.delete(data.key);
+        handleKeyUp(data.key);
+    } else if (data.type === 'modifier') {
+        handleModifierChange(data.key, data.value);
+    }
+}
 
 function connectWebSocket() {
     const statusEl = document.getElementById('status');
@@ -2244,7 +2269,9 @@ function connectWebSocket() {
     
     try {
         ws = new WebSocket(WS_URL);
-        
+        // Server sends binary JSON frames; arraybuffer avoids async Blob reads
+        ws.binaryType = 'arraybuffer';
+
         ws.onopen = () => {
             wsConnected = true;
             if (statusEl) statusEl.className = 'status connected';
@@ -2254,28 +2281,16 @@ function connectWebSocket() {
         
         ws.onmessage = (event) => {
             try {
-                const data = JSON.parse(event.data);
-                
-                // Skip WebSocket events if typing box is focused (avoid duplicates)
-                if (typingBoxFocused && (data.type === 'keydown' || data.type === 'keyup')) {
-                    return;
-                }
-                
-                if (data.type === 'keydown') {
-                    // Ignore key repeats (key already held down)
-                    if (heldKeys.has(data.key)) return;
-                    heldKeys.add(data.key);
-                    
-                    if (data.modifiers) {
-                        Object.assign(modifiers, data.modifiers);
-                        updateModifierDisplay();
-                    }
-                    handleKeyDown(data.key, modifiers, false);
-                } else if (data.type === 'keyup') {
-                    heldKeys.delete(data.key);
-                    handleKeyUp(data.key);
-                } else if (data.type === 'modifier') {
-                    handleModifierChange(data.key, data.value);
+                const raw = typeof event.data === 'string'
+                    ? event.data
+                    : wsDecoder.decode(event.data);
+                const data = JSON.parse(raw);
+
+                if (data.type === 'batch') {
+                    // Server coalesces rapid keypresses into one frame
+                    data.events.forEach(handleWsEvent);
+                } else {
+                    handleWsEvent(data);
                 }
             } catch (e) {
                 // Silently ignore parse errors